@@ -2,20 +2,21 @@
 Student Management System - Main Entry Point
 """
 import os
+import sys
 from student_manager import StudentManager
 from utils import load_config, save_config
 
+HEADER = "="*50 + "\n       STUDENT MANAGEMENT SYSTEM\n" + "="*50 + "\n"
+
 def main():
     # Print header
-    print("="*50)
-    print("       STUDENT MANAGEMENT SYSTEM")
-    print("="*50)
+    sys.stdout.write(HEADER)
     
     # Load configuration
     config = load_config()
     default_file_path = config.get('default_file_path', 'students.csv')
     
-    # Check if file exists
+    # Check if file exists (the manager then opens it directly, without a second check)
     if not os.path.exists(default_file_path):
         print(f"Default file '{default_file_path}' not found.")
         create_new = input("Would you like to create a new file? (y/n): ")
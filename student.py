@@ -1,25 +1,48 @@
 """
 Student class for the Student Management System
 """
-import json
+from utils import json_dumps
 
 class Student:
+    # Columns are defined per data file, so the fields live in one dict;
+    # __slots__ just drops the per-instance __dict__ around it.
+    __slots__ = ('data', '_json_cache')
+
     def __init__(self, **kwargs):
         self.data = kwargs
+        self._json_cache = None
 
     def __repr__(self):
-        return json.dumps(self.data)
+        return self.to_json()
+
+    def _invalidate(self):
+        """Drop the cached JSON after the student data has changed."""
+        self._json_cache = None
+
+    def set_value(self, key, value):
+        """Set a field value."""
+        self.data[key] = value
+        self._invalidate()
+
+    def remove_value(self, key):
+        """Remove a field if present and return its value."""
+        value = self.data.pop(key, None)
+        self._invalidate()
+        return value
+
+    def cache_json(self, json_string):
+        """Reuse an existing JSON encoding of the current data, e.g. as read from disk."""
+        self._json_cache = json_string
 
     def to_dict(self):
         return self.data
 
     def to_json(self):
         """Convert the student data to JSON format."""
-        return json.dumps(self.data)
+        if self._json_cache is None:
+            self._json_cache = json_dumps(self.data)
+        return self._json_cache
 
     def display(self):
         """Convert the student data to a human-readable string format."""
-        display_string = ""
-        for key, value in self.data.items():
-            display_string += f"{key}: {value}\n"
-        return display_string.strip() 
\ No newline at end of file
+        return "\n".join(f"{key}: {value}" for key, value in self.data.items()).strip() 
\ No newline at end of file
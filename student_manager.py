@@ -2,11 +2,73 @@
 Student Manager for the Student Management System
 """
 import os
+import sys
 import csv
 import json
+import itertools
+from contextlib import contextmanager
 from student import Student
 from validation import get_valid_input
-from utils import ensure_directory_exists, normalize_file_path
+from utils import (ensure_directory_exists, normalize_file_path, get_data_files_in_directory,
+                   save_config, json_dumps, json_loads)
+
+# Buffer size for reading and rewriting the data file
+IO_BUFFER_SIZE = 1 << 20
+
+# Markers written in the ID cell of rows that log a change instead of holding
+# a student: a deleted student ID, or a renamed column as a JSON [old, new] pair.
+# JSON Lines files use {"__deleted__": <ID>} and {"__renamed__": [old, new]} records.
+DELETED_MARKER = "__DELETED__"
+RENAMED_MARKER = "__RENAMED__"
+LOG_MARKERS = frozenset((DELETED_MARKER, RENAMED_MARKER))
+
+# Prefixes of the tab-separated header lines holding column names and types
+COLUMNS_PREFIX = "#COLS\t"
+TYPES_PREFIX = "#TYPES\t"
+
+# Column types assumed for CSV files written before types were stored
+DEFAULT_COLUMN_TYPES = {
+    'Name': 'str',
+    'Age': 'int',
+    'Email': 'str',
+    'Phone': 'str',
+    'Address': 'str',
+    'Class': 'str',
+    'Roll Number': 'int',
+    'Grades': 'str'
+}
+
+# Main menu, written in one call by show_menu()
+MENU = (
+    "\n1. Add Student\n"
+    "2. View Students\n"
+    "3. Update Student\n"
+    "4. Delete Student\n"
+    "5. Add Column\n"
+    "6. Delete Column\n"
+    "7. Replace Column\n"
+    "8. Change File Path\n"
+    "9. Exit\n"
+)
+
+# Column types that validation knows how to handle
+VALID_COLUMN_TYPES = frozenset(('str', 'int', 'float'))
+
+def _clean_column_types(column_types):
+    """Lower-case column types read from a file; unknown types fall back to 'str'."""
+    cleaned = {}
+    for column, column_type in column_types.items():
+        key = column_type.lower() if isinstance(column_type, str) else column_type
+        if key not in VALID_COLUMN_TYPES:
+            print(f"Warning: Unknown type '{column_type}' for column '{column}'. Using 'str' instead.")
+            key = 'str'
+        cleaned[column] = key
+    return cleaned
+
+def _split_header_line(line, prefix):
+    """Split a tab-separated header line into its values, without the prefix."""
+    values = line.rstrip("\n")[len(prefix):]
+    return values.split("\t") if values else []
 
 class StudentManager:
     def __init__(self, file_path='students.csv'):
@@ -15,101 +77,329 @@ class StudentManager:
             self.file_path = file_path  # Just use the filename in current directory
         else:
             self.file_path = file_path  # Use provided path
-        self.students = []
+        self.students = {}  # Student ID -> Student, in file order
         self.columns = []  # Start with an empty columns list
         self.column_types = {}  # To store expected types for each column
+        self._log_records = 0  # Deletion/rename rows still present in the file
+        self._file_exists = False  # Kept current by every load and save
+        self._header_loaded = False  # The file starts with a valid column header
+        self._batch_depth = 0  # Nesting level of batch_edit() blocks
+        self._batch_dirty = False  # A full save was deferred by batch_edit()
+        self._by_roll = {}  # Roll Number -> Student
+        # Menu choice -> action; '9' (exit) is handled by run() itself
+        self._actions = {
+            '1': self.add_student,
+            '2': self.view_students,
+            '3': self.update_student,
+            '4': self.delete_student,
+            '5': self.add_column,
+            '6': self.delete_column,
+            '7': self.replace_column,
+            '8': self.change_file_path,
+        }
         self._load_data()
 
-    def _load_data(self):
-        """Load existing data from CSV if available."""
-        if not os.path.exists(self.file_path):
-            print(f"Error: The file '{self.file_path}' does not exist.")
+    def _is_jsonl(self):
+        """Check whether the current data file uses the JSON Lines format."""
+        return self.file_path.endswith('.jsonl')
+
+    def _read_csv(self, file):
+        """
+        Read the column header of a CSV data file.
+        Returns an iterator of (student ID, JSON, None) rows, or None if the header is invalid.
+        """
+        first_line = file.readline()
+        if first_line.startswith(COLUMNS_PREFIX):
+            # Plain header lines: split on tabs, no CSV or JSON parsing needed
+            self.columns = _split_header_line(first_line, COLUMNS_PREFIX)
+            next_line = file.readline()
+            if next_line.startswith(TYPES_PREFIX):
+                self.column_types = _clean_column_types(
+                    dict(zip(self.columns, _split_header_line(next_line, TYPES_PREFIX))))
+                lines = file
+            else:
+                self.column_types = dict(DEFAULT_COLUMN_TYPES)
+                lines = itertools.chain([next_line], file)
+        else:
+            # Older files: a "Columns" CSV row holding the column names as JSON
+            header = next(csv.reader([first_line]), None)
+            if not header or len(header) < 2:
+                return None
+            try:
+                columns = json_loads(header[1])
+            except json.JSONDecodeError:
+                return None
+            if not isinstance(columns, list):
+                return None
+            self.columns = columns
+            self.column_types = dict(DEFAULT_COLUMN_TYPES)
+            lines = file
+        return ((student_id, student_json, None) for student_id, student_json in filter(None, csv.reader(lines)))
+
+    def _write_csv_header(self, file, csv_writer):
+        """Write the column names and types at the top of a CSV data file."""
+        if any("\t" in column or "\n" in column for column in self.columns):
+            # Names that cannot go in a tab-separated line use the older JSON header row
+            csv_writer.writerow(["Columns", json_dumps(self.columns)])
             return
+        file.write(COLUMNS_PREFIX + "\t".join(self.columns) + "\n")
+        file.write(TYPES_PREFIX + "\t".join(self.column_types.get(column, 'str') for column in self.columns) + "\n")
+
+    def _read_jsonl(self, file):
+        """
+        Read the header line of a JSON Lines data file.
+        Returns an iterator of (student ID, JSON, parsed data) rows, or None if the header is invalid.
+        """
+        first_line = file.readline()
+        header = json_loads(first_line) if first_line.strip() else None
+        if not isinstance(header, dict) or not isinstance(header.get('__columns__'), list):
+            return None
+        self.columns = header['__columns__']
+        types = header.get('__types__')
+        self.column_types = _clean_column_types(types) if isinstance(types, dict) and types else dict(DEFAULT_COLUMN_TYPES)
+        return self._jsonl_rows(file)
 
+    def _jsonl_rows(self, file):
+        """Yield (student ID, JSON, parsed data) for each record line of a JSON Lines file."""
+        for line_number, line in enumerate(file, 2):
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            try:
+                record = json_loads(line)
+            except json.JSONDecodeError:
+                print(f"Error: Invalid JSON format on line {line_number}.")
+                continue
+            if not isinstance(record, dict):
+                print(f"Error: Invalid JSON format on line {line_number}.")
+                continue
+            # Students always carry an ID, so a column named like a marker key
+            # cannot turn a student line into a log record
+            if 'ID' in record:
+                yield str(record['ID']), line, record
+            elif '__deleted__' in record:
+                yield DELETED_MARKER, record['__deleted__'], None
+            elif '__renamed__' in record:
+                yield RENAMED_MARKER, json_dumps(record['__renamed__']), None
+            else:
+                print(f"Error: Missing student ID on line {line_number}.")
+
+    def _reset_data(self):
+        """Forget the students, their lookup table and the state of the current file."""
+        self.students = {}
+        self._by_roll = {}
+        self._log_records = 0
+        self._header_loaded = False
+
+    def _load_data(self):
+        """Load existing data from CSV or JSON Lines if available."""
+        self._reset_data()
         try:
-            with open(self.file_path, mode="r") as file:
-                csv_reader = csv.reader(file)
-                header = next(csv_reader)  # Get the header row
-                if header and len(header) > 1:
-                    self.columns = json.loads(header[1])  # Deserialize JSON column names (stored in first row)
-                    
-                    # Define default column types
-                    default_column_types = {
-                        'Name': 'str',
-                        'Age': 'int',
-                        'Email': 'str',
-                        'Phone': 'str',
-                        'Address': 'str',
-                        'Class': 'str',
-                        'Roll Number': 'int',
-                        'Grades': 'str'
-                    }
-                    
-                    # Initialize column types
-                    self.column_types = default_column_types
-                    
-                    # Fix any RollNo to Roll Number in columns
-                    if 'RollNo' in self.columns and 'Roll Number' not in self.columns:
-                        self.columns = [col if col != 'RollNo' else 'Roll Number' for col in self.columns]
-                else:
+            with open(self.file_path, mode="r", encoding="utf-8", buffering=IO_BUFFER_SIZE) as file:
+                self._file_exists = True
+                rows = self._read_jsonl(file) if self._is_jsonl() else self._read_csv(file)
+                if rows is None:
                     print(f"Error: The file '{self.file_path}' does not have valid column data.")
                     return
+                self._header_loaded = True
 
-                for row in csv_reader:
-                    if row:
-                        student_id, student_json = row
-                        try:
-                            student_data = json.loads(student_json)  # Deserialize JSON data
-                            
-                            # Fix RollNo to Roll Number in student data
-                            if 'RollNo' in student_data and 'Roll Number' not in student_data:
-                                student_data['Roll Number'] = student_data.pop('RollNo')
-                            
-                            student_data.pop('ID', None)  # Remove 'ID' from student_data and pass separately to avoid conflict
-                            self.students.append(Student(ID=student_id, **student_data))  # Pass student_id separately
-                        except json.JSONDecodeError:
-                            print(f"Error: Invalid JSON format in row for student ID {student_id}.")
-                            continue
+                # Fix any RollNo to Roll Number in columns
+                if 'RollNo' in self.columns and 'Roll Number' not in self.columns:
+                    self.columns = [col if col != 'RollNo' else 'Roll Number' for col in self.columns]
+
+                # Bind names used for every row to locals once
+                students = self.students
+                index_student = self._index_student
+                unindex_student = self._unindex_student
+                loads = json_loads
+                make_student = Student
+                log_records = 0
+                roll_number_renamed = False
+
+                for student_id, student_json, student_data in rows:
+                    if student_id in LOG_MARKERS:
+                        log_records += 1
+                        if student_id == DELETED_MARKER:
+                            # Drop the student deleted after being written earlier in the file
+                            deleted = students.pop(student_json, None)
+                            if deleted:
+                                unindex_student(deleted)
+                        else:
+                            # Rename the column in everything read so far; later rows use the new name
+                            old_name, new_name = loads(student_json)
+                            self._rename_column(old_name, new_name)
+                            roll_number_renamed |= 'Roll Number' in (old_name, new_name)
+                        continue
+                    try:
+                        if student_data is None:
+                            student_data = loads(student_json)  # Deserialize JSON data
+                        
+                        # Fix RollNo to Roll Number in student data (a substring
+                        # test on the raw row skips the dict lookups for current files)
+                        migrated = ('RollNo' in student_json and 'RollNo' in student_data
+                                    and 'Roll Number' not in student_data)
+                        if migrated:
+                            student_data['Roll Number'] = student_data.pop('RollNo')
+                        
+                        stored_id = student_data.pop('ID', None)  # Remove 'ID' from student_data and pass separately to avoid conflict
+                        student = make_student(ID=student_id, **student_data)  # Pass student_id separately
+                        if not migrated and stored_id == student_id:
+                            # Row holds exactly this data, so saving can reuse it as-is
+                            student.cache_json(student_json)
+                        students[student_id] = student
+                        index_student(student)
+                    except json.JSONDecodeError:
+                        print(f"Error: Invalid JSON format in row for student ID {student_id}.")
+                        continue
+                self._log_records = log_records
+                if roll_number_renamed:
+                    self._rebuild_indexes()
+        except FileNotFoundError:
+            self._file_exists = False
+            print(f"Error: The file '{self.file_path}' does not exist.")
         except (OSError, IOError) as e:
             print(f"Error: Could not open or read the file '{self.file_path}'. Error: {e}")
         except Exception as e:
             print(f"Unexpected error while loading data: {e}")
 
     def _save_data(self):
-        """Save data into the CSV file as JSON."""
+        """Save data into the CSV or JSON Lines file."""
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated data file behind
+        temp_path = self.file_path + ".tmp"
+        replaced = False
         try:
             # Create directory if it doesn't exist (for new paths with directories)
             directory = os.path.dirname(self.file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                
-            with open(self.file_path, mode="w", newline="") as file:
-                csv_writer = csv.writer(file)
-                # Save the columns in the first row as JSON
-                csv_writer.writerow(["Columns", json.dumps(self.columns)])  # Save the column names as JSON
-                for student in self.students:
-                    student_json = student.to_json()  # Serialize student data to JSON
-                    csv_writer.writerow([student.data['ID'], student_json])  # Write student data
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            with open(temp_path, mode="w", newline="", encoding="utf-8", buffering=IO_BUFFER_SIZE) as file:
+                if self._is_jsonl():
+                    # Header line holds the columns and their types, then one student per line
+                    header = {
+                        '__columns__': self.columns,
+                        '__types__': {col: self.column_types.get(col, 'str') for col in self.columns}
+                    }
+                    file.write(json_dumps(header) + "\n")
+                    file.writelines(student.to_json() + "\n" for student in self.students.values())
+                else:
+                    csv_writer = csv.writer(file)
+                    self._write_csv_header(file, csv_writer)
+                    # One writerows call keeps the per-row loop inside the C csv module
+                    csv_writer.writerows(
+                        (student.data['ID'], student.to_json()) for student in self.students.values()
+                    )
+            os.replace(temp_path, self.file_path)
+            replaced = True
+            self._file_exists = True
+            self._header_loaded = True
+            self._log_records = 0
+            self._batch_dirty = False
+            return True
         except (OSError, IOError) as e:
             print(f"Error: Could not write to the file '{self.file_path}'. Error: {e}")
         except Exception as e:
             print(f"Unexpected error while saving data: {e}")
+        finally:
+            if not replaced and os.path.exists(temp_path):
+                os.remove(temp_path)
+        return False
+
+    def _save_or_defer(self):
+        """Rewrite the file now, or once the enclosing batch_edit() block ends."""
+        if self._batch_depth:
+            self._batch_dirty = True
+        else:
+            self._save_data()
+
+    @contextmanager
+    def batch_edit(self):
+        """
+        Group several edits so the file is rewritten once at the end.
+        Blocks may be nested; the save happens when the outermost one exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._save_data()
+
+    def _append_record(self, record_id, payload):
+        """Append a single student or marker record to the data file without rewriting it."""
+        if not self._header_loaded:
+            # Rows appended to a file without a valid header could not be read back
+            self._save_data()
+            return
+        try:
+            # "r+" rather than "a" so a file removed behind our back is not
+            # recreated without its column header
+            with open(self.file_path, mode="r+", newline="", encoding="utf-8") as file:
+                file.seek(0, os.SEEK_END)
+                if not self._is_jsonl():
+                    csv.writer(file).writerow([record_id, payload])
+                elif record_id == DELETED_MARKER:
+                    file.write(json_dumps({'__deleted__': payload}) + "\n")
+                elif record_id == RENAMED_MARKER:
+                    file.write(json_dumps({'__renamed__': json_loads(payload)}) + "\n")
+                else:
+                    file.write(payload + "\n")
+        except FileNotFoundError:
+            self._save_data()
+        except (OSError, IOError) as e:
+            print(f"Error: Could not write to the file '{self.file_path}'. Error: {e}")
+
+    def _append_student(self, student):
+        """Append a new student to the end of the data file."""
+        self._append_record(student.data['ID'], student.to_json())
+
+    def _append_log_record(self, marker, payload):
+        """Record a deletion or rename, rewriting the file once such records pile up."""
+        self._log_records += 1
+        if self._log_records > len(self.students) // 4:
+            self._save_or_defer()  # Compact: the full rewrite drops every log row
+        else:
+            self._append_record(marker, payload)
+
+    def _rename_column(self, old_name, new_name):
+        """Rename a column in the column list, the column types and every student."""
+        if old_name in self.columns:
+            self.columns[self.columns.index(old_name)] = new_name
+        if old_name in self.column_types:
+            self.column_types[new_name] = self.column_types.pop(old_name)
+        for student in self.students.values():
+            if old_name in student.data:
+                student.set_value(new_name, student.remove_value(old_name))
+
+    def _index_student(self, student):
+        """Add a student to the Roll Number lookup table."""
+        roll_number = student.data.get('Roll Number')
+        if roll_number is not None:
+            self._by_roll[roll_number] = student
 
-    def _check_unique_id(self, student_id):
-        """Check if the student ID is unique."""
-        return all(student.data['ID'] != student_id for student in self.students)
+    def _unindex_student(self, student):
+        """Remove a student from the Roll Number lookup table."""
+        roll_number = student.data.get('Roll Number')
+        if self._by_roll.get(roll_number) is student:
+            del self._by_roll[roll_number]
+
+    def _rebuild_indexes(self):
+        """Rebuild the lookup table, e.g. after the Roll Number column changed."""
+        self._by_roll = {}
+        for student in self.students.values():
+            self._index_student(student)
 
     def _check_unique_roll_number(self, roll_number):
         """Check if the roll number is unique."""
-        try:
-            return all(student.data.get('Roll Number') != roll_number for student in self.students)
-        except Exception:
-            return True  # If there's any error, assume the roll number is unique
+        return roll_number not in self._by_roll
 
     def add_student(self):
         """Add a new student."""
         # Ensure file exists, create if not
-        if not os.path.exists(self.file_path):
+        if not self._file_exists:
             print(f"File '{self.file_path}' does not exist. Creating a new file...")
             try:
                 self._setup_new_file()
@@ -119,6 +409,9 @@ class StudentManager:
 
         # Now, ask for the student data and add it to the file
         student_data = {}
+        students = self.students
+        by_roll = self._by_roll
+        get_column_type = self.column_types.get
 
         # Check for unique ID with validation
         while True:
@@ -126,7 +419,7 @@ class StudentManager:
             if not student_id.isdigit():
                 print("Student ID must contain only numbers. Please try again.")
                 continue
-            if not self._check_unique_id(student_id):
+            if student_id in students:
                 print(f"Error: Student with ID {student_id} already exists. Please enter a unique ID.")
             else:
                 student_data['ID'] = student_id
@@ -136,12 +429,12 @@ class StudentManager:
         # Ask for data based on expected types for each column
         for column in self.columns:
             if column != 'ID':  # Skip ID as it's already handled
-                expected_type = self.column_types.get(column, 'str')  # Default to 'str' if no type defined
+                expected_type = get_column_type(column, 'str')  # Default to 'str' if no type defined
                 if column == 'Roll Number':
                     # Special handling for Roll Number to check uniqueness
                     while True:
                         roll_number = get_valid_input(column, expected_type)
-                        if not self._check_unique_roll_number(roll_number):
+                        if roll_number in by_roll:
                             print(f"Error: Student with roll number {roll_number} already exists. Please enter a unique roll number.")
                             continue
                         student_data[column] = roll_number
@@ -150,8 +443,9 @@ class StudentManager:
                     student_data[column] = get_valid_input(column, expected_type)
 
         student = Student(**student_data)
-        self.students.append(student)
-        self._save_data()
+        students[student_id] = student
+        self._index_student(student)
+        self._append_student(student)
         print("Student added successfully!")
 
     def view_students(self):
@@ -159,26 +453,38 @@ class StudentManager:
         if not self.students:
             print(f"No student data found in file: {self.file_path}")
         else:
-            print(f"Student Data from file: {self.file_path}")
-            print(f"Total students: {len(self.students)}")
-            print("-" * 40)
-            for student in self.students:
-                print(student.display())
-                print("-" * 40)  # A separator for each student
+            separator = "-" * 40 + "\n"  # A separator for each student
+            parts = [f"Student Data from file: {self.file_path}\n",
+                     f"Total students: {len(self.students)}\n",
+                     separator]
+            for student in self.students.values():
+                parts.append(student.display() + "\n")
+                parts.append(separator)
+            # One write for the whole listing instead of two prints per student
+            sys.stdout.write("".join(parts))
+
+    def _show_columns(self, title):
+        """Print a title followed by the numbered column list in a single write."""
+        lines = [title + "\n"]
+        lines.extend(f"{i}. {column}\n" for i, column in enumerate(self.columns, 1))
+        sys.stdout.write("".join(lines))
 
     def update_student(self):
         """Update an existing student."""
         # Ensure file exists before updating
-        if not os.path.exists(self.file_path):
+        if not self._file_exists:
             print(f"File '{self.file_path}' does not exist. Please create it first.")
             return
         
         student_id = input("Enter student ID to update: ")
-        student = next((s for s in self.students if s.data.get("ID") == student_id), None)
+        student = self.students.get(student_id)
         if student:
-            for key, value in student.to_dict().items():
+            get_column_type = self.column_types.get
+            # Values are replaced in place and no keys are added or removed,
+            # so the live items view can be iterated without a copy
+            for key, value in student.data.items():
                 if key != 'ID':  # Don't allow ID to be updated
-                    expected_type = self.column_types.get(key, 'str')
+                    expected_type = get_column_type(key, 'str')
                     if key == 'Roll Number':
                         # Special handling for Roll Number to check uniqueness
                         while True:
@@ -186,12 +492,14 @@ class StudentManager:
                             if new_value != value and not self._check_unique_roll_number(new_value):
                                 print(f"Error: Student with roll number {new_value} already exists. Please enter a unique roll number.")
                                 continue
-                            student.data[key] = new_value
+                            self._unindex_student(student)
+                            student.set_value(key, new_value)
+                            self._index_student(student)
                             break
                     else:
                         new_value = get_valid_input(f"new {key}", expected_type)
-                        student.data[key] = new_value
-            self._save_data()
+                        student.set_value(key, new_value)
+            self._save_or_defer()
             print("Student information updated successfully!")
         else:
             print(f"No student found with ID {student_id}")
@@ -199,15 +507,16 @@ class StudentManager:
     def delete_student(self):
         """Delete a student."""
         # Ensure file exists before deleting
-        if not os.path.exists(self.file_path):
+        if not self._file_exists:
             print(f"File '{self.file_path}' does not exist. Please create it first.")
             return
         
         student_id = input("Enter student ID to delete: ")
-        student = next((s for s in self.students if s.data.get("ID") == student_id), None)
+        student = self.students.get(student_id)
         if student:
-            self.students.remove(student)
-            self._save_data()
+            del self.students[student_id]
+            self._unindex_student(student)
+            self._append_log_record(DELETED_MARKER, student_id)
             print(f"Student with ID {student_id} deleted.")
         else:
             print(f"No student found with ID {student_id}")
@@ -215,7 +524,7 @@ class StudentManager:
     def add_column(self):
         """Add a new column to the data."""
         # Ensure file exists before adding a column
-        if not os.path.exists(self.file_path):
+        if not self._file_exists:
             print(f"File '{self.file_path}' does not exist. Please create it first.")
             return
         
@@ -240,23 +549,24 @@ class StudentManager:
             if position_choice == '1':
                 # Add at the beginning
                 self.columns.insert(0, new_column)
+                inserted_pos = 0
                 break
             elif position_choice == '2':
                 # Add at the end
                 self.columns.append(new_column)
+                inserted_pos = len(self.columns) - 1
                 break
             elif position_choice == '3':
                 # Add at a specific position
                 if len(self.columns) > 0:
-                    print("\nCurrent columns:")
-                    for i, col in enumerate(self.columns):
-                        print(f"{i+1}. {col}")
+                    self._show_columns("\nCurrent columns:")
                         
                     while True:
                         try:
                             pos = int(input(f"Enter position (1-{len(self.columns)+1}): "))
                             if 1 <= pos <= len(self.columns) + 1:
                                 self.columns.insert(pos - 1, new_column)
+                                inserted_pos = pos - 1
                                 break
                             else:
                                 print(f"Please enter a number between 1 and {len(self.columns)+1}.")
@@ -265,6 +575,7 @@ class StudentManager:
                 else:
                     # If no columns, just add it
                     self.columns.append(new_column)
+                    inserted_pos = 0
                 break
             else:
                 print("Invalid choice. Please enter 1, 2, or 3.")
@@ -278,16 +589,31 @@ class StudentManager:
         self.column_types[new_column] = new_column_type.strip().lower()
         
         # Add the column to all existing student records
-        for student in self.students:
-            student.data[new_column] = get_valid_input(new_column, self.column_types[new_column])
+        new_column_type = self.column_types[new_column]
+        if self.students:
+            if new_column == 'Roll Number':
+                # Roll numbers must stay unique, so each student is always asked
+                uniform = 'n'
+            else:
+                uniform = input("Use same default value for all existing students? (y/n): ")
+            if uniform.lower() == 'y':
+                # One prompt, then fill every record with that value
+                default_value = get_valid_input(new_column, new_column_type)
+                for student in self.students.values():
+                    student.set_value(new_column, default_value)
+            else:
+                for student in self.students.values():
+                    student.set_value(new_column, get_valid_input(new_column, new_column_type))
+        if new_column == 'Roll Number':
+            self._rebuild_indexes()
             
-        self._save_data()
-        print(f"Column '{new_column}' added successfully at position {self.columns.index(new_column) + 1}.")
+        self._save_or_defer()
+        print(f"Column '{new_column}' added successfully at position {inserted_pos + 1}.")
 
     def delete_column(self):
         """Delete a column from the data."""
         # Ensure file exists before deleting a column
-        if not os.path.exists(self.file_path):
+        if not self._file_exists:
             print(f"File '{self.file_path}' does not exist. Please create it first.")
             return
             
@@ -296,9 +622,7 @@ class StudentManager:
             return
             
         # Show available columns
-        print("Available columns:")
-        for i, column in enumerate(self.columns, 1):
-            print(f"{i}. {column}")
+        self._show_columns("Available columns:")
             
         # Protected columns that cannot be deleted
         protected_columns = ['Roll Number', 'ID']
@@ -327,17 +651,17 @@ class StudentManager:
                         print("Column deletion cancelled.")
                         return
                         
-                    # Remove column from data structure
-                    self.columns.remove(column_to_delete)
+                    # Remove column from data structure (index is already known)
+                    del self.columns[column_index]
                     if column_to_delete in self.column_types:
                         self.column_types.pop(column_to_delete)
                         
                     # Remove column from all student records
-                    for student in self.students:
+                    for student in self.students.values():
                         if column_to_delete in student.data:
-                            student.data.pop(column_to_delete)
+                            student.remove_value(column_to_delete)
                             
-                    self._save_data()
+                    self._save_or_defer()
                     print(f"Column '{column_to_delete}' deleted successfully.")
                     return
                 else:
@@ -348,7 +672,7 @@ class StudentManager:
     def replace_column(self):
         """Replace or rename a column in the data."""
         # Ensure file exists before replacing a column
-        if not os.path.exists(self.file_path):
+        if not self._file_exists:
             print(f"File '{self.file_path}' does not exist. Please create it first.")
             return
             
@@ -357,9 +681,7 @@ class StudentManager:
             return
             
         # Show available columns
-        print("Available columns:")
-        for i, column in enumerate(self.columns, 1):
-            print(f"{i}. {column}")
+        self._show_columns("Available columns:")
             
         # Protected columns that cannot be replaced
         protected_columns = ['ID']
@@ -399,7 +721,8 @@ class StudentManager:
                     if change_type.lower() == 'y':
                         while True:
                             new_type = input(f"Enter new data type for column '{new_column_name}' (str, int, float): ")
-                            if new_type.lower() in ['str', 'int', 'float']:
+                            new_type = new_type.strip().lower()
+                            if new_type in VALID_COLUMN_TYPES:
                                 break
                             else:
                                 print("Invalid type. Please use 'str', 'int', or 'float'.")
@@ -414,34 +737,30 @@ class StudentManager:
                         return
                         
                     # Perform the replacement
-                    # Update column name in the list
-                    self.columns[column_index] = new_column_name
-                    
-                    # Update column type
-                    if column_to_replace in self.column_types:
-                        self.column_types[new_column_name] = new_type
-                        del self.column_types[column_to_replace]
+                    if current_type == new_type:
+                        # Pure rename: the same helper replays the logged rename on load
+                        self._rename_column(column_to_replace, new_column_name)
                     else:
+                        # Update column name in the list and its type
+                        self.columns[column_index] = new_column_name
+                        self.column_types.pop(column_to_replace, None)
                         self.column_types[new_column_name] = new_type
-                        
-                    # Update all student records
-                    for student in self.students:
-                        if column_to_replace in student.data:
-                            # First convert value to the proper type if needed
-                            old_value = student.data[column_to_replace]
-                            
-                            if current_type != new_type:
-                                # If changing type, ask for a new value
+
+                        # Ask for a value of the new type for every student that had the column
+                        for student in self.students.values():
+                            if column_to_replace in student.data:
+                                old_value = student.data[column_to_replace]
                                 print(f"\nCurrent value '{old_value}' needs to be converted to {new_type} for student ID {student.data.get('ID', 'unknown')}.")
-                                student.data[new_column_name] = get_valid_input(new_column_name, new_type)
-                            else:
-                                # If same type, just move the value
-                                student.data[new_column_name] = old_value
-                                
-                            # Remove the old column
-                            del student.data[column_to_replace]
+                                student.set_value(new_column_name, get_valid_input(new_column_name, new_type))
+                                student.remove_value(column_to_replace)
+                    if 'Roll Number' in (column_to_replace, new_column_name):
+                        self._rebuild_indexes()
                     
-                    self._save_data()
+                    if current_type == new_type:
+                        # Pure rename: log it instead of rewriting every row
+                        self._append_log_record(RENAMED_MARKER, json_dumps([column_to_replace, new_column_name]))
+                    else:
+                        self._save_or_defer()
                     print(f"Column '{column_to_replace}' replaced with '{new_column_name}' successfully.")
                     return
                 else:
@@ -453,7 +772,7 @@ class StudentManager:
         """Allow the user to change the file path."""
         print("\nChange File Path Options:")
         print("1. Create new file in current directory")
-        print("2. Browse existing CSV files in current directory")
+        print("2. Browse existing data files (CSV or JSON Lines) in current directory")
         print("3. Enter an absolute path")
         print("4. Cancel")
         
@@ -487,16 +806,15 @@ class StudentManager:
                 return
         
         elif choice == '2':
-            # Browse existing CSV files
-            from utils import get_csv_files_in_directory
-            print("\nAvailable CSV files in current directory:")
-            csv_files = get_csv_files_in_directory()
+            # Browse existing data files
+            print("\nAvailable data files in current directory:")
+            data_files = get_data_files_in_directory()
             
-            if not csv_files:
-                print("No CSV files found in current directory.")
+            if not data_files:
+                print("No data files found in current directory.")
                 return
                 
-            for i, file in enumerate(csv_files, 1):
+            for i, file in enumerate(data_files, 1):
                 print(f"{i}. {file}")
                 
             while True:
@@ -507,11 +825,11 @@ class StudentManager:
                         return
                         
                     file_index = int(file_choice) - 1
-                    if 0 <= file_index < len(csv_files):
-                        new_file_path = csv_files[file_index]
+                    if 0 <= file_index < len(data_files):
+                        new_file_path = data_files[file_index]
                         break
                     else:
-                        print(f"Please enter a number between 1 and {len(csv_files)}.")
+                        print(f"Please enter a number between 1 and {len(data_files)}.")
                 except ValueError:
                     print("Please enter a valid number.")
         
@@ -550,7 +868,7 @@ class StudentManager:
         self.file_path = new_file_path
         
         # Clear current data
-        self.students = []
+        self._reset_data()
         
         # Check if new file exists
         if os.path.exists(self.file_path):
@@ -578,11 +896,30 @@ class StudentManager:
         # Ask if user wants to make this file the default for future program runs
         default_choice = input("Would you like to make this the default file for future runs? (y/n): ")
         if default_choice.lower() == 'y':
-            from utils import save_config
             config = {'default_file_path': self.file_path}
             if save_config(config):
                 print(f"Default file set to: {self.file_path}")
 
+    def migrate_to_jsonl(self):
+        """
+        Save the current data as a JSON Lines file next to the CSV file and switch to it.
+        Returns True on success.
+        """
+        if self._is_jsonl():
+            print(f"File '{self.file_path}' is already in JSON Lines format.")
+            return False
+        new_file_path = os.path.splitext(self.file_path)[0] + '.jsonl'
+        if os.path.exists(new_file_path):
+            print(f"File '{new_file_path}' already exists. Migration canceled.")
+            return False
+        old_file_path = self.file_path
+        self.file_path = new_file_path
+        if not self._save_data():
+            self.file_path = old_file_path
+            return False
+        print(f"Data migrated from '{old_file_path}' to '{new_file_path}'.")
+        return True
+
     def _setup_new_file(self):
         """Set up columns for a new file."""
         # Define default columns with their types
@@ -660,38 +997,17 @@ class StudentManager:
 
     def show_menu(self):
         """Display the menu options."""
-        print("\n1. Add Student")
-        print("2. View Students")
-        print("3. Update Student")
-        print("4. Delete Student")
-        print("5. Add Column")
-        print("6. Delete Column")
-        print("7. Replace Column")
-        print("8. Change File Path")
-        print("9. Exit")
-        
+        sys.stdout.write(MENU)
+
     def run(self):
         """Run the CLI interface."""
         while True:
             self.show_menu()
             try:
                 choice = input("Enter your choice: ")
-                if choice == '1':
-                    self.add_student()
-                elif choice == '2':
-                    self.view_students()
-                elif choice == '3':
-                    self.update_student()
-                elif choice == '4':
-                    self.delete_student()
-                elif choice == '5':
-                    self.add_column()
-                elif choice == '6':
-                    self.delete_column()
-                elif choice == '7':
-                    self.replace_column()
-                elif choice == '8':
-                    self.change_file_path()
+                action = self._actions.get(choice)
+                if action:
+                    action()
                 elif choice == '9':
                     print("Exiting program.")
                     break
@@ -2,7 +2,36 @@
 Utility functions for the Student Management System
 """
 import os
-import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_dumps(data):
+    """
+    Serialize data to a compact JSON string, using orjson when installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass  # e.g. ints past 64 bits, which the stdlib encoder handles
+    import json  # Deferred: only needed without orjson or for values it rejects
+    return json.dumps(data, separators=(',', ':'))
+
+def json_loads(text):
+    """
+    Parse a JSON string, using orjson when installed.
+    Raises json.JSONDecodeError on invalid input either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity from files saved by the stdlib encoder; let it decide
+    import json  # Deferred, as in json_dumps()
+    return json.loads(text)
 
 def ensure_directory_exists(filepath):
     """
@@ -10,44 +39,62 @@ def ensure_directory_exists(filepath):
     Creates directories if they don't exist.
     """
     directory = os.path.dirname(filepath)
-    if directory and not os.path.exists(directory):
-        try:
-            os.makedirs(directory)
-            print(f"Directory '{directory}' created successfully.")
-            return True
-        except Exception as e:
-            print(f"Failed to create directory: {e}")
-            return False
-    return True
+    if not directory:
+        return True
+    try:
+        os.makedirs(directory, exist_ok=True)
+        return True
+    except (OSError, ValueError) as e:  # ValueError: embedded NUL in the path
+        print(f"Failed to create directory: {e}")
+        return False
 
-def get_csv_files_in_directory(directory='.'):
+def get_data_files_in_directory(directory='.'):
     """
-    Get a list of all CSV files in the specified directory.
+    Get a list of all data files (CSV or JSON Lines) in the specified directory.
     """
-    return [f for f in os.listdir(directory) if f.endswith('.csv')]
+    with os.scandir(directory) as entries:
+        return [e.name for e in entries
+                if e.name.endswith(('.csv', '.jsonl')) and e.is_file()]
 
 def normalize_file_path(file_path):
     """
-    Normalize a file path to ensure it has a .csv extension and is valid.
+    Normalize a file path to ensure it has a .csv (or .jsonl) extension and is valid.
     Returns the normalized path.
     """
-    # Make sure path has .csv extension
-    if not file_path.endswith('.csv'):
+    # Make sure path has .csv extension, unless JSON Lines was asked for
+    if not file_path.endswith(('.csv', '.jsonl')):
         file_path += '.csv'
     return file_path
 
+# Last parsed config.json, keyed on its modification time and size
+_CONFIG_CACHE = {'mtime': None, 'size': None, 'data': None}
+
 def load_config():
     """
     Load the configuration file for default settings.
+    The parsed file is cached until config.json changes on disk; callers get a copy.
     """
     config = {'default_file_path': 'students.csv'}
     try:
-        if os.path.exists('config.json'):
-            with open('config.json', 'r') as config_file:
-                loaded_config = json.load(config_file)
-                config.update(loaded_config)
+        st = os.stat('config.json')
+    except FileNotFoundError:
+        return config
+    except Exception as e:
+        print(f"Error reading config file: {e}")
+        return config
+
+    if (st.st_mtime_ns, st.st_size) == (_CONFIG_CACHE['mtime'], _CONFIG_CACHE['size']):
+        return _CONFIG_CACHE['data'].copy()
+
+    try:
+        with open('config.json', 'rb') as config_file:
+            loaded_config = json_loads(config_file.read())
+            config.update(loaded_config)
     except Exception as e:
         print(f"Error reading config file: {e}")
+        return config
+    import copy  # Deferred: only needed when config.json is (re)read
+    _CONFIG_CACHE.update(mtime=st.st_mtime_ns, size=st.st_size, data=copy.deepcopy(config))
     return config
 
 def save_config(config):
@@ -55,8 +102,16 @@ def save_config(config):
     Save the configuration to a file.
     """
     try:
-        with open('config.json', 'w') as config_file:
-            json.dump(config, config_file, indent=4)
+        # Serialise in one go and hand the file a single write
+        if orjson is not None:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            import json
+            data = json.dumps(config, indent=4).encode()
+        with open('config.json', 'wb') as config_file:
+            config_file.write(data)
+        # Drop the cached copy even if the new file has the same mtime and size
+        _CONFIG_CACHE['mtime'] = None
         return True
     except Exception as e:
         print(f"Failed to save config: {e}")
@@ -1,8 +1,175 @@
 """
 Validation functions for the Student Management System
 """
+import math
 import re
 
+# Email username pattern, compiled once at import
+_EMAIL_USER_RE = re.compile(r'^[a-zA-Z0-9._%+-]+$')
+
+# Accepted email domains; the tuple keeps the order used in the error message
+_VALID_EMAIL_DOMAINS_LIST = (
+    'gmail.com', 'hotmail.com', 'yahoo.com', 'outlook.com',
+    'icloud.com', 'protonmail.com', 'aol.com', 'mail.com',
+    'zoho.com', 'yandex.com', 'gmx.com', 'live.com'
+)
+_VALID_EMAIL_DOMAINS = frozenset(_VALID_EMAIL_DOMAINS_LIST)
+_VALID_EMAIL_DOMAINS_STR = ', '.join(_VALID_EMAIL_DOMAINS_LIST)
+
+def _check_age(value):
+    """Extra rules for the Age column."""
+    if value < 5 or value > 100:
+        return False, None, "Age must be between 5 and 100 years. Please try again."
+    return True, value, None
+
+def _check_roll_number(value):
+    """Extra rules for the Roll Number column."""
+    if value < 1:
+        return False, None, "Roll Number must be a positive number. Please try again."
+    if value > 9_999_999_999:
+        return False, None, "Roll Number cannot be more than 10 digits. Please try again."
+    return True, value, None
+
+def _check_name(user_input):
+    """Extra rules for the Name column."""
+    # Drop whitespace in one C-level split/join, then a single isalpha() scan
+    letters = "".join(user_input.split())
+    if letters and not letters.isalpha():
+        return False, None, "Name should only contain letters and spaces. Please try again."
+    if len(user_input) < 2:
+        return False, None, "Name must be at least 2 characters long. Please try again."
+    return True, user_input, None
+
+def _check_email(user_input):
+    """Extra rules for the Email column."""
+    # Check minimum length
+    if len(user_input) < 5:
+        return False, None, "Email must be at least 5 characters long. Please try again."
+
+    # Check for @ symbol
+    if '@' not in user_input:
+        return False, None, "Email must contain '@' symbol. Please try again."
+
+    # Accepted addresses are all ASCII; reject anything else in one C-level scan
+    if not user_input.isascii():
+        return False, None, "Invalid email format. Please enter a valid email address."
+
+    # Split on the last '@' and reject unknown domains before any regex work
+    username, _, domain = user_input.rpartition('@')
+    if domain.lower() not in _VALID_EMAIL_DOMAINS:
+        return False, None, f"Invalid email domain. Please use one of these domains: {_VALID_EMAIL_DOMAINS_STR}"
+
+    # Validate username
+    if len(username) < 1:
+        return False, None, "Email username cannot be empty. Please try again."
+
+    if len(username) > 64:
+        return False, None, "Email username is too long. Maximum length is 64 characters."
+
+    # Check for special characters in username
+    if not _EMAIL_USER_RE.match(username):
+        return False, None, "Email username can only contain letters, numbers, and these special characters: . _ % + -"
+
+    # Check total length
+    if len(user_input) > 254:  # RFC 5321 standard
+        return False, None, "Email is too long. Maximum length is 254 characters."
+    return True, user_input, None
+
+def _check_phone(user_input):
+    """Extra rules for the Phone column."""
+    if not user_input.isdigit():
+        return False, None, "Phone number must contain only digits. Please try again."
+    if len(user_input) < 10:
+        return False, None, "Phone number must be at least 10 digits long. Please try again."
+    if len(user_input) > 15:
+        return False, None, "Phone number cannot be more than 15 digits. Please try again."
+    return True, user_input, None
+
+def _check_address(user_input):
+    """Extra rules for the Address column."""
+    if len(user_input) < 5:
+        return False, None, "Address must be at least 5 characters long. Please provide a complete address."
+    # Check if address contains at least one letter
+    if not any(map(str.isalpha, user_input)):
+        return False, None, "Address must contain at least one letter. Please try again."
+    return True, user_input, None
+
+def _check_class(user_input):
+    """Extra rules for the Class column."""
+    if not user_input.isalnum():
+        return False, None, "Class should contain only letters and numbers. Please try again."
+    if len(user_input) < 2:
+        return False, None, "Class must be at least 2 characters long. Please try again."
+    if len(user_input) > 10:
+        return False, None, "Class name cannot be more than 10 characters. Please try again."
+    return True, user_input, None
+
+_VALID_GRADES = ('A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'F')
+
+def _check_grades(user_input):
+    """Extra rules for the Grades column."""
+    grade = user_input.upper()
+    if grade not in _VALID_GRADES:
+        return False, None, f"Invalid grade. Please enter one of these: {', '.join(_VALID_GRADES)}"
+    return True, grade, None
+
+# Column-specific rules, keyed on the lower-cased column name
+_INT_COLUMN_CHECKS = {
+    'age': _check_age,
+    'roll number': _check_roll_number,
+}
+_STR_COLUMN_CHECKS = {
+    'name': _check_name,
+    'email': _check_email,
+    'phone': _check_phone,
+    'address': _check_address,
+    'class': _check_class,
+    'grades': _check_grades,
+}
+
+def _validate_int(column_name, user_input):
+    """Validate input for an int column."""
+    # One int() pass does the parsing; int() also takes a sign, surrounding
+    # whitespace and '_' separators, which a plain digit string never has
+    try:
+        value = int(user_input)
+    except ValueError:
+        value = None
+    if value is None or not user_input[0].isdigit() or not user_input[-1].isdigit() or '_' in user_input:
+        return False, None, f"Invalid input for {column_name}. Expected a positive integer. Please try again."
+
+    check = _INT_COLUMN_CHECKS.get(column_name.lower())
+    if check is not None:
+        return check(value)
+    return True, value, None
+
+def _validate_float(column_name, user_input):
+    """Validate input for a float column."""
+    try:
+        value = float(user_input)
+        # float() also parses 'nan' and 'inf', which JSON cannot store
+        if not math.isfinite(value):
+            return False, None, f"Invalid input for {column_name}. Expected a valid number. Please try again."
+        if value < 0:
+            return False, None, f"Invalid input for {column_name}. Expected a positive number. Please try again."
+        return True, value, None
+    except ValueError:
+        return False, None, f"Invalid input for {column_name}. Expected a valid number. Please try again."
+
+def _validate_str(column_name, user_input):
+    """Validate input for a str column."""
+    check = _STR_COLUMN_CHECKS.get(column_name.lower())
+    if check is not None:
+        return check(user_input)
+    return True, str(user_input), None
+
+# Validator for each supported column type, looked up once per call
+_TYPE_VALIDATORS = {
+    'int': _validate_int,
+    'float': _validate_float,
+    'str': _validate_str,
+}
+
 def validate_input(column_name, user_input, expected_type):
     """
     Validate user input based on column name and expected type.
@@ -12,144 +179,23 @@ def validate_input(column_name, user_input, expected_type):
     if not user_input:
         return False, None, f"{column_name} cannot be empty. Please try again."
 
+    validator = _TYPE_VALIDATORS.get(expected_type)
+    if validator is None:
+        return False, None, f"Unsupported type {expected_type} for column {column_name}. Please try again."
+
     # Validate the input based on the expected type
-    try:
-        if expected_type == 'int':
-            if not user_input.isdigit():
-                return False, None, f"Invalid input for {column_name}. Expected a positive integer. Please try again."
-            value = int(user_input)
-            
-            # Additional validation for age
-            if column_name.lower() == 'age':
-                if value < 5 or value > 100:
-                    return False, None, "Age must be between 5 and 100 years. Please try again."
-            
-            # Additional validation for roll number
-            elif column_name.lower() == 'roll number':
-                if value < 1:
-                    return False, None, "Roll Number must be a positive number. Please try again."
-                if len(str(value)) > 10:
-                    return False, None, "Roll Number cannot be more than 10 digits. Please try again."
-            
-            return True, value, None
-        
-        elif expected_type == 'float':
-            try:
-                value = float(user_input)
-                if value < 0:
-                    return False, None, f"Invalid input for {column_name}. Expected a positive number. Please try again."
-                return True, value, None
-            except ValueError:
-                return False, None, f"Invalid input for {column_name}. Expected a valid number. Please try again."
-        
-        elif expected_type == 'str':
-            # Additional validation for specific fields
-            if column_name.lower() == 'name':
-                if not all(c.isalpha() or c.isspace() for c in user_input):
-                    return False, None, "Name should only contain letters and spaces. Please try again."
-                if len(user_input) < 2:
-                    return False, None, "Name must be at least 2 characters long. Please try again."
-            
-            elif column_name.lower() == 'email':
-                # Check minimum length
-                if len(user_input) < 5:
-                    return False, None, "Email must be at least 5 characters long. Please try again."
-                
-                # Check for @ symbol
-                if '@' not in user_input:
-                    return False, None, "Email must contain '@' symbol. Please try again."
-                
-                # Basic email regex pattern
-                email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                if not re.match(email_pattern, user_input):
-                    return False, None, "Invalid email format. Please enter a valid email address."
-                
-                try:
-                    # Split email into username and domain
-                    username, domain = user_input.split('@', 1)
-                    
-                    # Validate username
-                    if len(username) < 1:
-                        return False, None, "Email username cannot be empty. Please try again."
-                    
-                    if len(username) > 64:
-                        return False, None, "Email username is too long. Maximum length is 64 characters."
-                    
-                    # Validate domain
-                    valid_domains = [
-                        'gmail.com', 'hotmail.com', 'yahoo.com', 'outlook.com', 
-                        'icloud.com', 'protonmail.com', 'aol.com', 'mail.com',
-                        'zoho.com', 'yandex.com', 'gmx.com', 'live.com'
-                    ]
-                    
-                    # Check if domain ends with any valid domain
-                    valid_domain_found = False
-                    for valid_domain in valid_domains:
-                        if domain.lower() == valid_domain:
-                            valid_domain_found = True
-                            break
-                    
-                    if not valid_domain_found:
-                        return False, None, f"Invalid email domain. Please use one of these domains: {', '.join(valid_domains)}"
-                    
-                    # Check for special characters in username
-                    if not re.match(r'^[a-zA-Z0-9._%+-]+$', username):
-                        return False, None, "Email username can only contain letters, numbers, and these special characters: . _ % + -"
-                    
-                    # Check total length
-                    if len(user_input) > 254:  # RFC 5321 standard
-                        return False, None, "Email is too long. Maximum length is 254 characters."
-                
-                except ValueError:
-                    return False, None, "Invalid email format. Please try again."
-            
-            elif column_name.lower() == 'phone':
-                if not user_input.isdigit():
-                    return False, None, "Phone number must contain only digits. Please try again."
-                if len(user_input) < 10:
-                    return False, None, "Phone number must be at least 10 digits long. Please try again."
-                if len(user_input) > 15:
-                    return False, None, "Phone number cannot be more than 15 digits. Please try again."
-            
-            elif column_name.lower() == 'address':
-                if len(user_input) < 5:
-                    return False, None, "Address must be at least 5 characters long. Please provide a complete address."
-                # Check if address contains at least one number and one letter
-                
-                if not any(c.isalpha() for c in user_input):
-                    return False, None, "Address must contain at least one letter. Please try again."
-            
-            elif column_name.lower() == 'class':
-                if not user_input.isalnum():
-                    return False, None, "Class should contain only letters and numbers. Please try again."
-                if len(user_input) < 2:
-                    return False, None, "Class must be at least 2 characters long. Please try again."
-                if len(user_input) > 10:
-                    return False, None, "Class name cannot be more than 10 characters. Please try again."
-            
-            elif column_name.lower() == 'grades':
-                valid_grades = ['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'F']
-                if user_input.upper() not in valid_grades:
-                    return False, None, f"Invalid grade. Please enter one of these: {', '.join(valid_grades)}"
-                return True, user_input.upper(), None
-            
-            return True, str(user_input), None
-        
-        else:
-            return False, None, f"Unsupported type {expected_type} for column {column_name}. Please try again."
-    
-    except ValueError:
-        return False, None, f"Invalid input for {column_name}. Expected {expected_type}. Please try again."
+    return validator(column_name, user_input)
 
 def get_valid_input(column_name, expected_type):
     """Helper function to get valid input from the user based on the expected type."""
+    # Show available options for grades
+    col_key = column_name.lower()
+    if col_key == 'grades' or col_key.startswith('new grades'):
+        prompt = f"Enter {column_name} ({', '.join(_VALID_GRADES)}): "
+    else:
+        prompt = f"Enter {column_name}: "
+
     while True:
-        # Show available options for grades
-        if column_name.lower() == 'grades' or column_name.lower().startswith('new grades'):
-            prompt = f"Enter {column_name} (A+, A, A-, B+, B, B-, C+, C, C-, F): "
-        else:
-            prompt = f"Enter {column_name}: "
-            
         user_input = input(prompt).strip()
         is_valid, value, error_message = validate_input(column_name, user_input, expected_type)
         